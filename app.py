@@ -3,37 +3,472 @@ import os
 import shutil
 import tempfile
 import json
-from collections import deque
+import re
+import unicodedata
+import math
+import mmap
+import codecs
+import io
+import functools
+import itertools
+import weakref
+from bisect import bisect_right
+from collections import deque, OrderedDict
 
 # PDF Handling
 import fitz  # PyMuPDF
+import numpy as np
 
 # Excel exports only (remove Word)
 import openpyxl
 import pandas as pd
 import tempfile
 
+# Optional C JSON parser; the viewer falls back to the json module without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional Rust xlsx/xls reader; Excel tabs fall back to openpyxl/pandas without it
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+# Optional streaming xlsx writer; saves fall back to pandas' default engine
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
 # PyQt5 imports
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QTabWidget, QFileDialog,
     QAction, QToolBar, QMessageBox, QLabel, QVBoxLayout,
     QScrollArea, QWidget, QLineEdit, QDialog, QHBoxLayout,
     QSpinBox, QComboBox, QPushButton, QStackedWidget,
-    QColorDialog, QTextEdit, QMenu, QMenuBar,
-    QTableWidget, QTableWidgetItem, QTextBrowser, QInputDialog
+    QColorDialog, QTextEdit, QPlainTextEdit, QMenu, QMenuBar,
+    QTableView, QTextBrowser, QInputDialog
 )
 from PyQt5.QtGui import (
     QCursor, QFont, QColor, QPixmap, QImage, QTextCursor
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import (
+    Qt, QTimer, QObject, QRunnable, QThreadPool, QSignalBlocker, pyqtSignal,
+    QAbstractTableModel, QModelIndex
+)
+from PyQt5 import sip
+
+
+# Discrete zoom steps; snapping keeps render cache keys stable across zoom in/out
+ZOOM_LEVELS = (0.5, 0.75, 1.0, 1.25, 1.5, 2.0, 3.0)
+
+
+def next_zoom_level(zoom, step):
+    """Return the zoom level `step` places above (+1) or below (-1) `zoom`."""
+    if step > 0:
+        return next((z for z in ZOOM_LEVELS if z > zoom + 1e-6), ZOOM_LEVELS[-1])
+    return next((z for z in reversed(ZOOM_LEVELS) if z < zoom - 1e-6), ZOOM_LEVELS[0])
+
+
+def bisect_first(count, predicate):
+    """
+    Smallest i in [0, count) with predicate(i) true, for a predicate that
+    stays true once it becomes true. Returns `count` if it never holds.
+    """
+    lo, hi = 0, count
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if predicate(mid):
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+@functools.lru_cache(maxsize=32)
+def compile_terms(terms, whole_words=False, ignore_case=True):
+    """
+    Compile a tuple of literal search terms into one alternation pattern,
+    longest first so overlapping terms prefer the most specific match.
+    Cached, so searching every page of a document compiles it once.
+    """
+    pattern = "|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True))
+    if whole_words:
+        pattern = rf"(?<!\S)(?:{pattern})(?!\S)"
+    return re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+
+
+def fold_text(text):
+    """Normalize text for case-insensitive search (ligatures, width variants, case)."""
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+# Preset text colors offered in the toolbar (RGB in 0..1)
+TEXT_COLORS = {
+    "Black": (0, 0, 0),
+    "Red": (1, 0, 0),
+    "Blue": (0, 0, 1),
+    "Green": (0, 1, 0)
+}
+
+
+# Soft cap for MuPDF's global resource store (fonts, images, display lists).
+# PyMuPDF has no runtime setter for the store limit, so it is trimmed instead.
+MUPDF_STORE_BUDGET = 128 << 20
+
+
+def trim_mupdf_store(percent=50):
+    """Shrink MuPDF's store by `percent` once it has grown past the budget."""
+    if fitz.TOOLS.store_size > MUPDF_STORE_BUDGET:
+        fitz.TOOLS.store_shrink(percent)
+
+
+def pixmap_to_qimage(pix):
+    """
+    Convert a fitz.Pixmap to an owning QImage in Qt's native pixmap format.
+    The samples are wrapped by address (pix.samples_ptr) without a bytes
+    copy; the single format conversion produces the image's own buffer, so
+    `pix` may be freed afterwards. Safe to call on a worker thread.
+    """
+    img = QImage(pix.samples_ptr, pix.width, pix.height, pix.stride, QImage.Format_RGB888)
+    return img.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+
+
+def qimage_to_qpixmap(img):
+    """Wrap an image from pixmap_to_qimage() without a second format conversion."""
+    return QPixmap.fromImage(img, Qt.NoFormatConversion)
+
+
+def logical_pixels(device_pixels, dpr):
+    """Whole logical pixels covering `device_pixels` at device pixel ratio `dpr`."""
+    return math.ceil(device_pixels / dpr - 0.001)
+
+
+def qpixmap_nbytes(pixmap):
+    """Approximate pixel memory held by a QPixmap."""
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+
+def pixmap_to_qpixmap(pix):
+    """Convert a fitz.Pixmap to a QPixmap."""
+    return qimage_to_qpixmap(pixmap_to_qimage(pix))
+
+
+def read_pdf_layout(pdf_path):
+    """
+    Return (pdf_path, page_sizes) with the unzoomed (width, height) of every
+    page. Runs on a worker thread with its own document handle.
+    """
+    with fitz.open(pdf_path) as doc:
+        if doc.page_count == 0:
+            raise ValueError("PDF file is invalid or has no pages.")
+        return pdf_path, [(page.rect.width, page.rect.height) for page in doc]
+
+
+def read_excel_rows(file_path):
+    """Return (headers, rows) from the first sheet of an Excel workbook."""
+    if CalamineWorkbook is not None:
+        return read_excel_rows_calamine(file_path)
+
+    if os.path.splitext(file_path)[1].lower() == '.xls':
+        # openpyxl only reads xlsx; legacy .xls goes through pandas/xlrd
+        df = pd.read_excel(file_path)
+        return [str(c) for c in df.columns], list(df.itertuples(index=False, name=None))
+
+    # Read-only mode streams the sheet XML instead of building a full DOM
+    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+        header_row = next(rows, ())
+        headers = [
+            str(h) if h is not None else f"Column {i+1}"
+            for i, h in enumerate(header_row)
+        ]
+        # Row tuples are kept as produced by the single pass over the sheet
+        return headers, list(rows)
+    finally:
+        wb.close()
+
+
+def parse_json(text):
+    """
+    Parse JSON text (str or bytes), using orjson when it is installed.
+    Callers only use the result to validate, so orjson's lossy handling of
+    integers wider than 64 bits doesn't matter here.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN and +/-Infinity, which the json module accepts
+            pass
+    return json.loads(text)
+
+
+def read_excel_rows_calamine(file_path):
+    """read_excel_rows() via python-calamine, which parses both xlsx and xls."""
+    sheet = CalamineWorkbook.from_path(file_path).get_sheet_by_index(0)
+    rows = iter(sheet.to_python())
+    header_row = next(rows, [])
+    headers = [
+        str(h) if h not in (None, "") else f"Column {i+1}"
+        for i, h in enumerate(header_row)
+    ]
+    # Calamine reports every number as a float; show whole numbers as ints
+    # like openpyxl does. Rows become tuples so cached results stay immutable.
+    return headers, [
+        tuple(int(v) if type(v) is float and v.is_integer() else v for v in row)
+        for row in rows
+    ]
+
+
+def read_json_text(file_path):
+    """Return the text of a JSON file after checking that it parses."""
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    parse_json(raw)
+    return raw.decode('utf-8')
+
+
+def read_csv_rows(file_path):
+    """Return (headers, rows) from a CSV file."""
+    try:
+        # Multithreaded Arrow parser; columns stay Arrow-backed instead of
+        # being materialized as object arrays
+        df = pd.read_csv(file_path, engine="pyarrow", dtype_backend="pyarrow")
+    except (ImportError, ValueError, TypeError):
+        # pyarrow missing, pandas too old for dtype_backend, or input the
+        # Arrow parser rejects
+        df = pd.read_csv(file_path)
+    return [str(c) for c in df.columns], list(df.itertuples(index=False, name=None))
+
+
+def write_document_text(document, file_path):
+    """
+    Write a QTextDocument's plain text to `file_path` block by block, so the
+    whole text is never held as one string (unlike toPlainText()).
+    """
+    with open(file_path, 'w', encoding='utf-8') as f:
+        block = document.begin()
+        while block.isValid():
+            # Same substitutions toPlainText() makes
+            f.write(block.text().replace("\u2028", "\n").replace("\xa0", " "))
+            block = block.next()
+            if block.isValid():
+                f.write("\n")
+
+
+def write_excel(df, file_path):
+    """Save `df` as a workbook, using the faster xlsxwriter engine when available."""
+    if xlsxwriter is None or os.path.splitext(file_path)[1].lower() != '.xlsx':
+        df.to_excel(file_path, index=False)
+        return
+    # Not constant_memory: to_excel writes column by column, and that mode
+    # silently drops writes to rows it has already flushed
+    with pd.ExcelWriter(file_path, engine="xlsxwriter") as writer:
+        df.to_excel(writer, index=False)
+
+
+def write_text_sheets(texts, file_path):
+    """
+    Write one sheet per entry of `texts` ("Page1", "Page2", ...) with a row
+    per line, streaming rows to disk with xlsxwriter when it is available.
+    """
+    if xlsxwriter is None:
+        wb = openpyxl.Workbook(write_only=True)
+        for p, text in enumerate(texts):
+            ws = wb.create_sheet(title=f"Page{p+1}")
+            for line in text.splitlines():
+                ws.append([line])
+        wb.save(file_path)
+        return
+    with xlsxwriter.Workbook(file_path, {"constant_memory": True}) as wb:
+        for p, text in enumerate(texts):
+            ws = wb.add_worksheet(f"Page{p+1}")
+            for row, line in enumerate(text.splitlines()):
+                ws.write_string(row, 0, line)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_file(parse, path, mtime_ns, size):
+    return parse(path)
+
+
+def parse_file_cached(parse, file_path):
+    """
+    Return parse(file_path), reusing the last result while the file is
+    unchanged on disk. Results are shared between tabs, so callers must
+    not mutate them in place (TableModel copies rows before editing).
+    """
+    path = os.path.abspath(file_path)
+    st = os.stat(path)
+    return _parse_file(parse, path, st.st_mtime_ns, st.st_size)
+
+
+###############################################################################
+# DocumentPool: Read-only fitz.Documents shared by tabs showing the same file
+###############################################################################
+class DocumentPool:
+    """
+    Read-only documents keyed by absolute path, shared by the viewers that
+    hold them. Viewers share a pooled document until their first edit, when
+    they switch to a private working copy and release it.
+    """
+    def __init__(self):
+        self._docs = {}  # abs path -> [fitz.Document, set of sharing viewers]
+
+    def acquire(self, path, viewer):
+        path = os.path.abspath(path)
+        entry = self._docs.get(path)
+        if entry is None:
+            entry = self._docs[path] = [fitz.open(path), set()]
+        entry[1].add(viewer)
+        return entry[0]
+
+    def release(self, path, viewer):
+        path = os.path.abspath(path)
+        entry = self._docs.get(path)
+        if entry is None:
+            return
+        entry[1].discard(viewer)
+        if not entry[1]:
+            entry[0].close()
+            del self._docs[path]
+
+    def detach_all(self, path):
+        """
+        Move every viewer sharing `path` to a private copy of it. Called
+        before the file is overwritten, so they keep the content they show
+        and later opens read the new file.
+        """
+        entry = self._docs.get(os.path.abspath(path))
+        if entry is None:
+            return
+        for viewer in list(entry[1]):
+            viewer.detach_from_pool()
+
+
+###############################################################################
+# RenderTask: Rasterizes one PDF page on a worker thread
+###############################################################################
+class RenderSignals(QObject):
+    # page index, zoom, page version, rendered QImage
+    finished = pyqtSignal(int, float, int, QImage)
+    # page index, zoom, page version, error message
+    failed = pyqtSignal(int, float, int, str)
+
+
+class WorkerDocument:
+    """
+    A viewer's render-thread handle on its working file, reopened only when
+    the file changed on disk (saveIncr, rotation, switch to a working copy)
+    instead of once per render. Used by one render task at a time; the
+    owner closes it after draining its render pool.
+    """
+    def __init__(self):
+        self._key = None
+        self._doc = None
+
+    def get(self, path):
+        st = os.stat(path)
+        key = (path, st.st_mtime_ns, st.st_size)
+        if key != self._key:
+            self.close()
+            self._doc = fitz.open(path)
+            self._key = key
+        return self._doc
+
+    def close(self):
+        if self._doc is not None:
+            self._doc.close()
+        self._doc = None
+        self._key = None
+
+
+class RenderTask(QRunnable):
+    """
+    Renders a page from the on-disk working copy. MuPDF documents are not
+    thread-safe, so the task reads through the viewer's WorkerDocument
+    instead of sharing the GUI thread's document.
+    """
+    def __init__(self, worker_doc, pdf_path, index, zoom, matrix, version, dpr=1.0):
+        super().__init__()
+        self.worker_doc = worker_doc
+        self.pdf_path = pdf_path
+        self.index = index
+        self.zoom = zoom
+        self.matrix = matrix
+        self.version = version
+        self.dpr = dpr
+        # Set from the GUI thread when the page scrolls away before the task starts
+        self.cancelled = False
+        self.signals = RenderSignals()
+
+    def run(self):
+        if self.cancelled:
+            return
+        try:
+            page = self.worker_doc.get(self.pdf_path).load_page(self.index)
+            pix = page.get_pixmap(matrix=self.matrix, alpha=False)
+            # Format conversion happens here, off the GUI thread
+            img = pixmap_to_qimage(pix)
+            img.setDevicePixelRatio(self.dpr)
+            self.signals.finished.emit(self.index, self.zoom, self.version, img)
+        except Exception as e:
+            # Don't keep a handle that may be what failed
+            self.worker_doc.close()
+            self.signals.failed.emit(self.index, self.zoom, self.version, str(e))
+
+
+class ParseSignals(QObject):
+    # context passed to the task, parsed result / error message
+    loaded = pyqtSignal(object, object)
+    failed = pyqtSignal(object, str)
+
+
+class ParseTask(QRunnable):
+    """
+    Runs a file parser (read_excel_rows, read_csv_rows, ...) off the GUI
+    thread, through the parse cache. Only the parse happens here; widgets
+    are built from the result on the GUI thread.
+    """
+    def __init__(self, parse, file_path, context):
+        super().__init__()
+        self.parse = parse
+        self.file_path = file_path
+        self.context = context
+        self.signals = ParseSignals()
+
+    def run(self):
+        try:
+            result = parse_file_cached(self.parse, self.file_path)
+        except Exception as e:
+            self.signals.failed.emit(self.context, str(e))
+            return
+        self.signals.loaded.emit(self.context, result)
+
+
+class RemoveTreeTask(QRunnable):
+    """Deletes a directory tree off the GUI thread."""
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+
+    def run(self):
+        shutil.rmtree(self.path, ignore_errors=True)
 
 
 ###############################################################################
 # PageWidget: Container for each PDF page’s rendered image
 ###############################################################################
 class PageWidget(QWidget):
-    def __init__(self, parent=None):
+    def __init__(self, owner, page_index, parent=None):
         super().__init__(parent)
+        # Back-pointer to the PDFViewWidget and this page's current index in it
+        self.owner = owner
+        self.page_index = page_index
         self.layout = QVBoxLayout()
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.setLayout(self.layout)
@@ -50,30 +485,19 @@ class PageWidget(QWidget):
 
     def show_context_menu(self, position):
         menu = QMenu(self)
-        
-        # Get parent PDFViewWidget
-        parent = self.parent()
-        while parent and not isinstance(parent, PDFViewWidget):
-            parent = parent.parent()
-            
-        if parent and isinstance(parent, PDFViewWidget):
-            # Add Edit/Stop Editing toggle
-            if not parent.edit_mode:
-                edit_action = menu.addAction("Edit")
-                edit_action.triggered.connect(parent.enable_edit_mode)
-            else:
-                stop_edit_action = menu.addAction("Stop Editing")
-                stop_edit_action.triggered.connect(parent.disable_edit_mode)
-            
-            menu.addSeparator()
-            close_page_action = menu.addAction("Close This Page")
-            try:
-                page_index = parent.page_widgets.index(self)
-                close_page_action.triggered.connect(
-                    lambda: parent.remove_page(page_index)
-                )
-            except ValueError:
-                pass
+        owner = self.owner
+
+        # Add Edit/Stop Editing toggle
+        if not owner.edit_mode:
+            edit_action = menu.addAction("Edit")
+            edit_action.triggered.connect(owner.enable_edit_mode)
+        else:
+            stop_edit_action = menu.addAction("Stop Editing")
+            stop_edit_action.triggered.connect(owner.disable_edit_mode)
+
+        menu.addSeparator()
+        close_page_action = menu.addAction("Close This Page")
+        close_page_action.triggered.connect(lambda: owner.remove_page(self.page_index))
 
         menu.exec_(self.mapToGlobal(position))
 
@@ -86,11 +510,15 @@ class PDFViewWidget(QWidget):
     Displays one PDF file in multiple pages (PageWidgets).
     Allows in-place text editing where the user clicks.
     """
-    def __init__(self, pdf_file_path, parent=None):
+    def __init__(self, pdf_file_path, parent=None, doc_pool=None, page_sizes=None):
         super().__init__(parent)
 
         self.original_pdf_path = pdf_file_path
         self.doc = None
+        # Set while showing a pooled read-only document (no working copy yet)
+        self.doc_pool = None
+        # Kept after detaching, so saves can detach other viewers of the target
+        self.document_pool = doc_pool
         self.zoom = 1.0
         self.edit_mode = False
         self.text_placement_mode = False
@@ -98,6 +526,59 @@ class PDFViewWidget(QWidget):
         self.undo_stack = deque(maxlen=50)  # Store last 50 actions
         self.redo_stack = deque(maxlen=50)
 
+        # Rendered pixmaps keyed by (page_index, zoom, page_version), bounded by
+        # their pixel memory rather than a count, since a page at 3x zoom is
+        # 36 times the size of one at 0.5x
+        self._pix_cache = OrderedDict()
+        self._pix_cache_bytes = 0
+        self._pix_cache_budget = 192 << 20
+        self._matrix_cache = {}
+        # Pages are rasterized at zoom x the screen's device pixel ratio, so
+        # HiDPI screens show them at native resolution instead of upscaled
+        self._render_dpr = 1.0
+        # Recently used fitz.Page objects, so repeated edits on a page don't reload it
+        self._page_cache = OrderedDict()
+        self._page_cache_size = 16
+        # Current version of each page. Versions come from one counter, so a
+        # version identifies a page state even after pages shift position.
+        self._page_versions = []
+        self._version_counter = itertools.count()
+        # Unzoomed (width, height) of each page, read from page.rect once
+        self._page_sizes = []
+        # Extracted text per (page_index, page_version, kind)
+        self._text_cache = OrderedDict()
+        self._text_cache_size = 64
+        # Case-folded page text for substring search: page_index -> (page_version, text).
+        # Kept outside the LRU so a whole-document search doesn't evict it.
+        self._search_texts = {}
+        # Page versions whose render failure was already reported, and whether
+        # a failure dialog is open (failures meanwhile don't stack more dialogs)
+        self._reported_failures = set()
+        self._failure_dialog_open = False
+        # Result of the last all_pages_text() call: (page versions, texts)
+        self._all_pages_text = None
+        # Pages currently holding a rendered pixmap (only those near the viewport)
+        self._rendered_pages = set()
+        self._prefetch_pages = 2
+        self.page_widgets = []
+
+        # Single worker: renders are serialized, the GUI thread stays free
+        self.render_pool = QThreadPool(self)
+        self.render_pool.setMaxThreadCount(1)
+        self._worker_doc = WorkerDocument()
+        # Queued or running renders: (page_index, zoom, page_version) -> RenderTask
+        self._pending_renders = {}
+        # Pages modified in memory but not yet written to the working copy;
+        # workers can't see these changes, so they render on the GUI thread
+        self._unsaved_pages = set()
+
+        # Edits are written to the working copy in batches, not per change
+        self._dirty = False
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self.flush_save)
+
         # Map from GUI font names to built-in PDF fonts (to fix "need font file" error).
         self.font_map = {
             "Arial": "helv",              # "Helvetica" base-14
@@ -112,18 +593,24 @@ class PDFViewWidget(QWidget):
             'size': 12,
             'color': (0, 0, 0)  # black in RGB (0-1)
         }
+        self.set_text_style(self.text_style)
 
-        # Create a temporary working copy of the PDF
+        # Share a pooled document until the first edit, otherwise
+        # create a temporary working copy of the PDF right away
         try:
-            self.temp_dir = tempfile.mkdtemp(prefix="pdf_viewer_")
-            temp_filename = os.path.basename(pdf_file_path)
-            self.working_pdf_path = os.path.join(self.temp_dir, f"working_{temp_filename}")
-
-            shutil.copy2(pdf_file_path, self.working_pdf_path)
-            self.doc = fitz.open(self.working_pdf_path)
+            if doc_pool is not None:
+                self.doc = doc_pool.acquire(pdf_file_path, self)
+                self.doc_pool = doc_pool
+                self.working_pdf_path = pdf_file_path
+            else:
+                self.create_working_copy()
 
             if not self.doc or self.doc.page_count == 0:
                 raise ValueError("PDF file is invalid or has no pages.")
+            self._page_versions = [next(self._version_counter) for _ in range(len(self.doc))]
+            if page_sizes is not None and len(page_sizes) == len(self.doc):
+                # Measured ahead of time (see read_pdf_layout); copied since we edit it
+                self._page_sizes = list(page_sizes)
         except Exception as e:
             QMessageBox.critical(None, "Error", f"Could not open PDF file:\n{str(e)}")
             self.cleanup_temp_files()
@@ -145,8 +632,8 @@ class PDFViewWidget(QWidget):
         self.content_layout.setAlignment(Qt.AlignHCenter)
         self.content_widget.setLayout(self.content_layout)
         self.scroll_area.setWidget(self.content_widget)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self.render_visible_pages)
 
-        self.page_widgets = []
         self.load_pages()
 
         # QLineEdit for placing new text
@@ -195,11 +682,9 @@ class PDFViewWidget(QWidget):
         self.text_placement_mode = True
         
         # Add mouse event handling to each page
-        for i, pg_widget in enumerate(self.page_widgets):
+        for pg_widget in self.page_widgets:
             pg_widget.page_label.setMouseTracking(True)
-            pg_widget.page_label.mousePressEvent = lambda e, idx=i: self.handle_edit_click(e, idx)
-            pg_widget.page_label.setContextMenuPolicy(Qt.CustomContextMenu)
-            pg_widget.page_label.customContextMenuRequested.connect(lambda pos, idx=i: self.show_page_context_menu(pos, idx))
+            pg_widget.page_label.mousePressEvent = lambda e, w=pg_widget: self.handle_edit_click(e, w.page_index)
 
         self.dragging = False
 
@@ -223,63 +708,339 @@ class PDFViewWidget(QWidget):
             return
 
         try:
-            page = self.doc[self.current_page_index]
+            self.ensure_working_copy()
+            page = self.load_page(self.current_page_index)
             word = self.current_text_edit.original_word
             rect = fitz.Rect(word[0], word[1], word[2], word[3])
             
             # Create and apply redaction
             page.add_redact_annot(rect)
-            page.apply_redactions()
+            page.apply_redactions(images=fitz.PDF_REDACT_IMAGE_NONE)
             
-            self.doc.saveIncr()
+            self.mark_dirty(self.current_page_index)
+            self.mark_page_changed(self.current_page_index)
             self.show_page(self.current_page_index)
             self.current_text_edit.hide()
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Could not delete text:\n{str(e)}")
 
     def load_pages(self):
-        """Load and render all pages from the PDF doc."""
+        """Create a placeholder per page; pixmaps are rendered once visible."""
+        if not self._page_sizes:
+            self.read_page_sizes()
+        # Lay the pages out once at the end instead of repainting per page
+        self.content_widget.setUpdatesEnabled(False)
         for i in range(len(self.doc)):
-            page_widget = PageWidget(self.content_widget)
+            page_widget = PageWidget(self, i, self.content_widget)
             self.content_layout.addWidget(page_widget)
             self.content_layout.addSpacing(20)
 
             self.page_widgets.append(page_widget)
+            self.resize_page_placeholder(i)
+        self.content_widget.setUpdatesEnabled(True)
+
+    def load_page(self, index):
+        """The fitz.Page at `index`, reused until the page tree changes."""
+        page = self._page_cache.get(index)
+        if page is not None:
+            self._page_cache.move_to_end(index)
+            return page
+        page = self._page_cache[index] = self.doc.load_page(index)
+        if len(self._page_cache) > self._page_cache_size:
+            self._page_cache.popitem(last=False)
+        return page
+
+    def read_page_sizes(self):
+        """(Re)read every page's unzoomed size, e.g. after loading or rotating."""
+        self._page_sizes = [(page.rect.width, page.rect.height) for page in self.doc]
+
+    def scaled_page_size(self, index):
+        # The device-pixel size is rounded outward like MuPDF's irect, then
+        # converted back exactly as set_page_pixmap() does, so the placeholder
+        # matches the rendered pixmap and installing it doesn't relayout
+        dpr = self._render_dpr
+        width, height = self._page_sizes[index]
+        return (logical_pixels(math.ceil(width * self.zoom * dpr - 0.001), dpr),
+                logical_pixels(math.ceil(height * self.zoom * dpr - 0.001), dpr))
+
+    def resize_page_placeholder(self, index):
+        """Size a page label from the page rect so layout is right before rendering."""
+        self.page_widgets[index].page_label.setFixedSize(*self.scaled_page_size(index))
+
+    def visible_page_range(self):
+        """Return (first, last) indices of pages intersecting the viewport, plus prefetch."""
+        top = self.scroll_area.verticalScrollBar().value()
+        bottom = top + self.scroll_area.viewport().height()
+        # Pages are stacked top to bottom, so binary search instead of
+        # checking every page's geometry on each scroll step
+        widgets = self.page_widgets
+        first = bisect_first(len(widgets), lambda i: widgets[i].geometry().bottom() >= top)
+        end = bisect_first(len(widgets), lambda i: widgets[i].geometry().top() > bottom)
+        if first >= end:
+            return 0, min(self._prefetch_pages, len(widgets) - 1)
+        return (max(0, first - self._prefetch_pages),
+                min(len(widgets) - 1, end - 1 + self._prefetch_pages))
+
+    def render_visible_pages(self):
+        """Render pages near the viewport and release pixmaps of the others."""
+        if not self.page_widgets or not self.doc:
+            return
+        self.sync_device_pixel_ratio()
+        first, last = self.visible_page_range()
+        wanted = set(range(first, last + 1))
+        for i in self._rendered_pages - wanted:
+            if i < len(self.page_widgets):
+                self.page_widgets[i].page_label.setPixmap(QPixmap())
+        # Renders queued for pages that scrolled away are no longer needed;
+        # ones already running finish and land in the cache
+        for key in [k for k in self._pending_renders if k[0] not in wanted]:
+            self._pending_renders.pop(key).cancelled = True
+        self._rendered_pages = wanted
+        for i in sorted(wanted):
             self.show_page(i)
 
+    def refresh_pages(self, preview=False):
+        """
+        Resize every placeholder (e.g. after zoom/rotation) and re-render visible pages.
+        With `preview`, pages already on screen are shown as a fast rescale of their
+        current pixmap until the sharp render arrives.
+        """
+        previews = {}
+        if preview:
+            for i in self._rendered_pages:
+                pixmap = self.page_widgets[i].page_label.pixmap()
+                if pixmap is not None and not pixmap.isNull():
+                    previews[i] = pixmap
+        for i, pg_widget in enumerate(self.page_widgets):
+            self.resize_page_placeholder(i)
+            if i in previews:
+                scaled = previews[i].scaled(
+                    pg_widget.page_label.size() * self._render_dpr,
+                    Qt.IgnoreAspectRatio, Qt.FastTransformation
+                )
+                scaled.setDevicePixelRatio(self._render_dpr)
+                pg_widget.page_label.setPixmap(scaled)
+            else:
+                pg_widget.page_label.setPixmap(QPixmap())
+        self._rendered_pages = set(previews)
+        self.content_widget.adjustSize()
+        self.render_visible_pages()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Geometry is only final once the layout has run
+        QTimer.singleShot(0, self.render_visible_pages)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.render_visible_pages()
+
+    def mark_page_changed(self, index):
+        """Invalidate cached renders of a page after it was modified."""
+        if 0 <= index < len(self._page_versions):
+            self._page_versions[index] = next(self._version_counter)
+            # Older renders of the page can never be shown again
+            for key in [k for k in self._pix_cache if k[0] == index]:
+                self._pix_cache_bytes -= qpixmap_nbytes(self._pix_cache.pop(key))
+            # Release stale text data now rather than waiting for eviction;
+            # cached TextPages hold MuPDF memory
+            for key in [k for k in self._text_cache if k[0] == index]:
+                del self._text_cache[key]
+
+    def mark_dirty(self, index):
+        """Record an edit to page `index` and schedule a deferred save."""
+        self._unsaved_pages.add(index)
+        self._dirty = True
+        self._save_timer.start()
+
+    def flush_save(self):
+        """Write pending in-memory changes to the working copy."""
+        self._save_timer.stop()
+        if not self._dirty:
+            return True
+        try:
+            self.doc.saveIncr()
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Could not save changes:\n{str(e)}")
+            return False
+        self._dirty = False
+        self._unsaved_pages.clear()
+        trim_mupdf_store()
+        return True
+
+    def render_page_image(self, index):
+        """Rasterize a page from the in-memory document on the calling thread."""
+        page = self.load_page(index)
+        pix = page.get_pixmap(matrix=self.zoom_matrix(self.zoom), alpha=False)
+        pixmap = pixmap_to_qpixmap(pix)
+        pixmap.setDevicePixelRatio(self._render_dpr)
+        return pixmap
+
+    def zoom_matrix(self, zoom):
+        """Scaling matrix for a zoom level at the current pixel ratio, built once per level."""
+        matrix = self._matrix_cache.get(zoom)
+        if matrix is None:
+            scale = zoom * self._render_dpr
+            matrix = self._matrix_cache[zoom] = fitz.Matrix(scale, scale)
+        return matrix
+
+    def sync_device_pixel_ratio(self):
+        """
+        Follow the device pixel ratio of the screen the viewer is on. Renders
+        made for another ratio are dropped, e.g. after moving to another screen.
+        """
+        dpr = self.devicePixelRatioF() or 1.0
+        if dpr == self._render_dpr:
+            return
+        self._render_dpr = dpr
+        self._matrix_cache.clear()
+        self.clear_pixmap_cache()
+        for task in self._pending_renders.values():
+            task.cancelled = True
+        self._pending_renders.clear()
+        # Placeholder sizes depend on the ratio's rounding
+        for i in range(len(self.page_widgets)):
+            self.resize_page_placeholder(i)
+
+    def cache_pixmap(self, key, pixmap):
+        old = self._pix_cache.pop(key, None)
+        if old is not None:
+            self._pix_cache_bytes -= qpixmap_nbytes(old)
+        self._pix_cache[key] = pixmap
+        self._pix_cache_bytes += qpixmap_nbytes(pixmap)
+        # Evict least recently used pixmaps, but always keep the newest one
+        while self._pix_cache_bytes > self._pix_cache_budget and len(self._pix_cache) > 1:
+            _, evicted = self._pix_cache.popitem(last=False)
+            self._pix_cache_bytes -= qpixmap_nbytes(evicted)
+
+    def clear_pixmap_cache(self):
+        self._pix_cache.clear()
+        self._pix_cache_bytes = 0
+
     def show_page(self, index):
-        """Render a single PDF page and display it in the PageWidget."""
+        """Display a page from the cache, or queue it for rendering on the worker."""
         if not self.doc:
             return
-        try:
-            page = self.doc.load_page(index)
-            mat = fitz.Matrix(self.zoom, self.zoom)
-            pix = page.get_pixmap(matrix=mat, alpha=False)
-            img = QImage(
-                pix.samples, pix.width, pix.height,
-                pix.stride, QImage.Format_RGB888
-            )
-            pixmap = QPixmap.fromImage(img)
+        key = (index, round(self.zoom, 3), self._page_versions[index])
+        pixmap = self._pix_cache.get(key)
+        if pixmap is not None:
+            self._pix_cache.move_to_end(key)
+            self.set_page_pixmap(index, pixmap)
+            return
+        if index in self._unsaved_pages:
+            try:
+                pixmap = self.render_page_image(index)
+            except Exception as e:
+                QMessageBox.warning(self, "Error", f"Could not load page {index+1}:\n{str(e)}")
+                return
+            self.cache_pixmap(key, pixmap)
+            self.set_page_pixmap(index, pixmap)
+            return
+        self.queue_render(index, self.zoom)
 
-            page_widget = self.page_widgets[index]
-            page_widget.page_label.setPixmap(pixmap)
-            page_widget.page_label.adjustSize()
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Could not load page {index+1}:\n{str(e)}")
+    def queue_render(self, index, zoom):
+        """Rasterize a page at `zoom` on the worker unless it is cached or in flight."""
+        key = (index, round(zoom, 3), self._page_versions[index])
+        if key in self._pending_renders or key in self._pix_cache:
+            return
+        task = RenderTask(
+            self._worker_doc, self.working_pdf_path, index, zoom, self.zoom_matrix(zoom),
+            self._page_versions[index], self._render_dpr
+        )
+        self._pending_renders[key] = task
+        task.signals.finished.connect(self.on_page_rendered)
+        task.signals.failed.connect(self.on_page_render_failed)
+        self.render_pool.start(task)
+
+    def prewarm_adjacent_zooms(self):
+        """Render the first visible page at the neighbouring zoom levels while idle."""
+        if not self.page_widgets or not self.doc:
+            return
+        first, _ = self.visible_page_range()
+        if first in self._unsaved_pages:
+            return
+        for step in (1, -1):
+            zoom = next_zoom_level(self.zoom, step)
+            if zoom != self.zoom:
+                self.queue_render(first, zoom)
+
+    def set_page_pixmap(self, index, pixmap):
+        page_label = self.page_widgets[index].page_label
+        # Placeholders are pre-sized, so normally this doesn't touch the layout
+        dpr = pixmap.devicePixelRatio()
+        size = (logical_pixels(pixmap.width(), dpr), logical_pixels(pixmap.height(), dpr))
+        if (page_label.width(), page_label.height()) != size:
+            page_label.setFixedSize(*size)
+        page_label.setPixmap(pixmap)
+        self._rendered_pages.add(index)
+
+    def on_page_rendered(self, index, zoom, version, img):
+        """Install a worker-rendered page, dropping results that went stale meanwhile."""
+        key = (index, round(zoom, 3), version)
+        self._pending_renders.pop(key, None)
+        if index >= len(self._page_versions) or version != self._page_versions[index]:
+            return
+        if img.devicePixelRatio() != self._render_dpr:
+            return
+        pixmap = qimage_to_qpixmap(img)
+        trim_mupdf_store()
+        self.cache_pixmap(key, pixmap)
+        if round(zoom, 3) == round(self.zoom, 3) and index in self._rendered_pages:
+            self.set_page_pixmap(index, pixmap)
+
+    def on_page_render_failed(self, index, zoom, version, message):
+        """Forget the failed render so the page can be retried, and report it once per page version."""
+        self._pending_renders.pop((index, round(zoom, 3), version), None)
+        if index >= len(self._page_versions) or version != self._page_versions[index]:
+            return
+        already_reported = version in self._reported_failures or self._failure_dialog_open
+        self._reported_failures.add(version)
+        if already_reported:
+            return
+        self._failure_dialog_open = True
+        try:
+            QMessageBox.warning(self, "Error", f"Could not load page {index+1}:\n{message}")
+        finally:
+            self._failure_dialog_open = False
 
     def remove_page(self, index):
         """Remove a page from the PDF and update the UI."""
         try:
+            self.ensure_working_copy()
             page_widget = self.page_widgets.pop(index)
             self.content_layout.removeWidget(page_widget)
             page_widget.deleteLater()
+            for i in range(index, len(self.page_widgets)):
+                self.page_widgets[i].page_index = i
 
             self.doc.delete_page(index)
-            self.doc.saveIncr()
+            self._page_cache.clear()
+            # Workers render from disk by index, so structural changes are written now
+            self._dirty = True
+            self.flush_save()
+
+            # Later pages moved up one index. Their versions are unchanged, so
+            # cached pixmaps stay valid once re-keyed, while in-flight renders
+            # (keyed by the old index) fail the version check and are dropped.
+            del self._page_versions[index]
+            del self._page_sizes[index]
+            self._pix_cache = OrderedDict(
+                ((i - (i > index), zoom, version), pixmap)
+                for (i, zoom, version), pixmap in self._pix_cache.items() if i != index
+            )
+            self._pix_cache_bytes = sum(qpixmap_nbytes(p) for p in self._pix_cache.values())
+            self._search_texts = {
+                i - (i > index): entry for i, entry in self._search_texts.items() if i != index
+            }
+            # TextPages refer to Page objects that delete_page() invalidated
+            self._text_cache.clear()
 
-            # Re-render the remaining pages
-            for i in range(len(self.page_widgets)):
-                self.show_page(i)
+            # Page widgets moved up with their pages and keep their pixmaps;
+            # only pages entering or leaving the window need work
+            self._rendered_pages = {
+                i - (i > index) for i in self._rendered_pages if i != index
+            }
+            self.render_visible_pages()
 
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Could not remove page {index+1}:\n{str(e)}")
@@ -287,21 +1048,91 @@ class PDFViewWidget(QWidget):
     def rotate_all_pages(self, degrees=90):
         """Rotate all pages in the PDF."""
         try:
+            self.ensure_working_copy()
             for page in self.doc:
                 page.set_rotation(degrees)
-            self.doc.save(self.working_pdf_path)
-            for i in range(len(self.page_widgets)):
-                self.show_page(i)
+            self._page_cache.clear()
+            # Rotation only touches each page's /Rotate entry, so append an
+            # incremental update instead of rewriting the whole file. Until it
+            # succeeds, pages render from the in-memory document.
+            self._unsaved_pages.update(range(len(self._page_versions)))
+            self._dirty = True
+            self.flush_save()
+            self._page_versions = [next(self._version_counter) for _ in self._page_versions]
+            self.clear_pixmap_cache()
+            self.read_page_sizes()
+            self.refresh_pages()
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Could not rotate pages:\n{str(e)}")
 
+    def create_working_copy(self):
+        """Copy the original PDF to a temp dir and open the copy for editing."""
+        self.temp_dir = tempfile.mkdtemp(prefix="pdf_viewer_")
+        # Backstop: removes the directory when this widget is collected or the
+        # interpreter exits without cleanup_temp_files() having run
+        self._temp_dir_finalizer = weakref.finalize(self, shutil.rmtree, self.temp_dir, True)
+        temp_filename = os.path.basename(self.original_pdf_path)
+        self.working_pdf_path = os.path.join(self.temp_dir, f"working_{temp_filename}")
+
+        shutil.copy2(self.original_pdf_path, self.working_pdf_path)
+        self.doc = fitz.open(self.working_pdf_path)
+        self._page_cache.clear()
+
+    def ensure_working_copy(self):
+        """Detach from the shared document before the first modification."""
+        if self.doc_pool is None:
+            return
+        self.create_working_copy()
+        doc_pool, self.doc_pool = self.doc_pool, None
+        doc_pool.release(self.original_pdf_path, self)
+        # Cached TextPages belong to the shared document
+        self._text_cache.clear()
+
+    def detach_from_pool(self):
+        """
+        Switch to a private copy because another viewer is about to overwrite
+        the shared file. Queued and running renders read the old path, so
+        every page gets a new version and the visible ones are re-rendered.
+        """
+        if self.doc_pool is None:
+            return
+        self.ensure_working_copy()
+        for task in self._pending_renders.values():
+            task.cancelled = True
+        self._pending_renders.clear()
+        self._page_versions = [next(self._version_counter) for _ in self._page_versions]
+        self.clear_pixmap_cache()
+        self.render_visible_pages()
+
     def cleanup_temp_files(self):
-        """Clean up temporary files/folders."""
+        """Clean up temporary files/folders. Safe to call more than once."""
         try:
-            if self.doc:
+            # Workers read the working copy, let them finish before deleting it
+            self._save_timer.stop()
+            self.render_pool.clear()
+            self.render_pool.waitForDone()
+            self._worker_doc.close()
+            self._page_cache.clear()
+            if self.doc_pool is not None:
+                doc_pool, self.doc_pool = self.doc_pool, None
+                doc_pool.release(self.original_pdf_path, self)
+            elif self.doc is not None:
                 self.doc.close()
-            if hasattr(self, 'temp_dir') and os.path.isdir(self.temp_dir):
-                shutil.rmtree(self.temp_dir)
+                fitz.TOOLS.store_shrink(100)
+            self.doc = None
+            self.clear_pixmap_cache()
+            self._text_cache.clear()
+            self._search_texts.clear()
+            self._all_pages_text = None
+
+            # Closing a tab shouldn't wait on deleting the working copy
+            temp_dir = getattr(self, 'temp_dir', None)
+            self.temp_dir = None
+            finalizer = getattr(self, '_temp_dir_finalizer', None)
+            if finalizer is not None:
+                finalizer.detach()
+            if temp_dir and os.path.isdir(temp_dir):
+                QThreadPool.globalInstance().start(RemoveTreeTask(temp_dir))
         except Exception as ex:
             print(f"Cleanup error: {ex}")
 
@@ -312,29 +1143,41 @@ class PDFViewWidget(QWidget):
     def save_as(self, new_path):
         """Save working PDF to a new location."""
         try:
-            shutil.copy2(self.working_pdf_path, new_path)
+            if not self.flush_save():
+                return False
+            if os.path.abspath(new_path) == os.path.abspath(self.working_pdf_path):
+                return True  # Unedited shared document saved over itself
+            if self.document_pool is not None:
+                # Other tabs may be showing the file about to be replaced
+                self.document_pool.detach_all(new_path)
+            if self.doc_pool is not None:
+                # Never edited: the original file is already the result
+                shutil.copy2(self.working_pdf_path, new_path)
+                return True
+            # The working copy carries one incremental update per flush; write a
+            # compacted copy. A separate handle is used because garbage collection
+            # renumbers objects, after which self.doc could no longer saveIncr().
+            with fitz.open(self.working_pdf_path) as doc:
+                doc.save(new_path, garbage=3, deflate=True)
             return True
         except Exception as e:
             QMessageBox.critical(self, "Error Saving", f"Could not save:\n{str(e)}")
             return False
 
+    def all_pages_text(self):
+        """Plain text of every page, in order, reused until any page changes."""
+        versions = tuple(self._page_versions)
+        if self._all_pages_text is not None and self._all_pages_text[0] == versions:
+            return self._all_pages_text[1]
+
+        texts = [self.page_text(p) for p in range(len(self.doc))]
+        self._all_pages_text = (versions, texts)
+        return texts
+
     def export_to_excel(self, xlsx_path):
         """Export text from each page into an .xlsx workbook (one sheet per page)."""
         try:
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "Page1"
-            for p in range(len(self.doc)):
-                if p > 0:
-                    ws = wb.create_sheet(title=f"Page{p+1}")
-                page = self.doc.load_page(p)
-                text = page.get_text("text")
-                lines = text.splitlines()
-                row = 1
-                for line in lines:
-                    ws.cell(row=row, column=1, value=line)
-                    row += 1
-            wb.save(xlsx_path)
+            write_text_sheets(self.all_pages_text(), xlsx_path)
             return True
         except Exception as e:
             QMessageBox.warning(self, "Export Failed", f"Excel export failed:\n{str(e)}")
@@ -348,26 +1191,29 @@ class PDFViewWidget(QWidget):
         if not self.doc:
             return False
         try:
-            page = self.doc[page_number]
-            matches = page.search_for(old_text)
+            self.ensure_working_copy()
+            page = self.load_page(page_number)
+            matches = page.search_for(old_text, textpage=self.page_textpage(page_number))
             if matches:
-                # Convert user font name to base-14
-                fontname = self.font_map.get(self.text_style['font'], "helv")
+                fontname, fontsize, color = self.resolved_style
+                # Redact out all old text first; the content stream is rewritten once.
+                # Only text is being replaced, so images under it are left alone.
                 for rect in matches:
-                    # Redact out old text
                     page.add_redact_annot(rect)
-                    page.apply_redactions()
+                page.apply_redactions(images=fitz.PDF_REDACT_IMAGE_NONE)
+                for rect in matches:
                     # Insert new text in roughly the same position
                     x0, y0, x1, y1 = rect
                     height = y1 - y0
                     page.insert_text(
                         (x0, y0 + height * 0.8),
                         new_text,
-                        fontsize=self.text_style['size'],
+                        fontsize=fontsize,
                         fontname=fontname,
-                        color=self.text_style['color']
+                        color=color
                     )
-                self.doc.saveIncr()
+                self.mark_dirty(page_number)
+                self.mark_page_changed(page_number)
                 self.show_page(page_number)
                 return True
             return False
@@ -375,17 +1221,114 @@ class PDFViewWidget(QWidget):
             QMessageBox.warning(self, "Error", f"Failed to edit text:\n{str(e)}")
             return False
 
+    def cached_page_data(self, page_number, kind, build):
+        """Return build(page), memoized until the page is modified."""
+        key = (page_number, self._page_versions[page_number], kind)
+        data = self._text_cache.get(key)
+        if data is not None:
+            self._text_cache.move_to_end(key)
+            return data
+        data = build(self.load_page(page_number))
+        self._text_cache[key] = data
+        if len(self._text_cache) > self._text_cache_size:
+            self._text_cache.popitem(last=False)
+        return data
+
+    def page_text(self, page_number):
+        """Plain text of a page."""
+        return self.cached_page_data(
+            page_number, "text",
+            lambda page: page.get_text("text", textpage=self.page_textpage(page_number))
+        )
+
+    def page_textpage(self, page_number):
+        """The page's parsed fitz.TextPage, shared by searches and text extraction."""
+        return self.cached_page_data(page_number, "textpage", lambda page: page.get_textpage())
+
+    def page_words(self, page_number):
+        """Word tuples (x0, y0, x1, y1, word, ...) of a page."""
+        return self.page_word_index(page_number)[0]
+
+    def page_word_rects(self, page_number):
+        """Word boxes of a page as an (n_words, 4) float32 array of x0, y0, x1, y1."""
+        return self.cached_page_data(
+            page_number, "word_rects",
+            lambda page: np.asarray(
+                [w[:4] for w in self.page_words(page_number)], dtype=np.float32
+            ).reshape(-1, 4)
+        )
+
+    def word_at(self, page_number, x, y):
+        """Return the first word tuple whose box contains (x, y), or None."""
+        r = self.page_word_rects(page_number)
+        mask = (r[:, 0] <= x) & (x <= r[:, 2]) & (r[:, 1] <= y) & (y <= r[:, 3])
+        if not mask.any():
+            return None
+        return self.page_words(page_number)[int(mask.argmax())]
+
+    def page_word_index(self, page_number):
+        """Return (words, joined_text, word_starts) for a page."""
+        def build(page):
+            words = page.get_text("words", textpage=self.page_textpage(page_number))
+            starts = []
+            offset = 0
+            for word in words:
+                starts.append(offset)
+                offset += len(word[4]) + 1
+            return words, " ".join(word[4] for word in words), starts
+        return self.cached_page_data(page_number, "words", build)
+
+    def find_terms(self, page_number, terms, whole_words=False, ignore_case=True):
+        """
+        Find several terms on a page in a single pass over its text.
+        Returns {term: [fitz.Rect, ...]} with the rect of every word a match touches.
+        """
+        terms = [t.strip() for t in terms if t and t.strip()]
+        results = {t: [] for t in terms}
+        if not terms:
+            return results
+        words, joined, starts = self.page_word_index(page_number)
+
+        pattern = compile_terms(tuple(results), whole_words, ignore_case)
+        normalize = str.lower if ignore_case else (lambda t: t)
+        lookup = {normalize(t): t for t in terms}
+
+        for match in pattern.finditer(joined):
+            term = lookup.get(normalize(match.group()))
+            if term is None:
+                continue
+            first = bisect_right(starts, match.start()) - 1
+            last = bisect_right(starts, match.end() - 1) - 1
+            results[term].extend(fitz.Rect(w[:4]) for w in words[first:last + 1])
+        return results
+
     def add_highlight(self, page_number, text):
         """Highlight all occurrences of `text` on a given page."""
+        return self.add_highlights(page_number, [text])
+
+    def add_highlights(self, page_number, terms):
+        """Highlight all occurrences of every term in `terms` on a given page."""
         if not self.doc:
             return False
         try:
-            page = self.doc[page_number]
-            matches = page.search_for(text)
-            for rect in matches:
+            # Exact substring rects, as search_for gives them (matches may span
+            # lines or hyphenation), from the shared TextPage. Found before
+            # detaching, so pages without a hit are not copied, saved or re-rendered.
+            textpage = self.page_textpage(page_number)
+            page = self.load_page(page_number)
+            rects = [
+                rect for term in dict.fromkeys(t.strip() for t in terms if t and t.strip())
+                for rect in page.search_for(term, textpage=textpage)
+            ]
+            if not rects:
+                return False
+            self.ensure_working_copy()
+            page = self.load_page(page_number)
+            for rect in rects:
                 annot = page.add_highlight_annot(rect)
                 annot.update()
-            self.doc.saveIncr()
+            self.mark_dirty(page_number)
+            self.mark_page_changed(page_number)
             self.show_page(page_number)
             return True
         except Exception as e:
@@ -397,25 +1340,22 @@ class PDFViewWidget(QWidget):
         if not self.doc:
             return False
         try:
-            page = self.doc[page_number]
-            # Get exact word locations with more context
-            words = page.get_text("words")
-            matches = []
-            
-            # Find exact matches only
-            for word in words:
-                if word[4].strip() == text.strip():  # Compare exact text
-                    rect = fitz.Rect(word[0], word[1], word[2], word[3])
-                    matches.append(rect)
-            
+            self.ensure_working_copy()
+            page = self.load_page(page_number)
+            # Exact, case-sensitive matches of whole words only
+            matches = self.find_terms(
+                page_number, [text], whole_words=True, ignore_case=False
+            ).get(text.strip(), [])
+
             if matches:
                 for rect in matches:
                     # Add small padding to avoid overlapping with nearby text
                     rect.x0 -= 1
                     rect.x1 += 1
                     page.add_redact_annot(rect)
-                page.apply_redactions()
-                self.doc.saveIncr()
+                page.apply_redactions(images=fitz.PDF_REDACT_IMAGE_NONE)
+                self.mark_dirty(page_number)
+                self.mark_page_changed(page_number)
                 self.show_page(page_number)
                 return True
             return False
@@ -428,13 +1368,24 @@ class PDFViewWidget(QWidget):
         if not self.doc:
             return False
         try:
-            page = self.doc[page_number]
-            matches = page.search_for(text)
-            return len(matches) > 0
+            return fold_text(text) in self.search_text(page_number)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to find text:\n{str(e)}")
             return False
 
+    def search_text(self, page_number):
+        """Case-folded plain text of a page, extracted once per page version."""
+        version = self._page_versions[page_number]
+        entry = self._search_texts.get(page_number)
+        if entry is None or entry[0] != version:
+            # Reuse the page's TextPage if one is cached, but don't build and
+            # keep one for every page a document-wide search walks over
+            textpage = self._text_cache.get((page_number, version, "textpage"))
+            text = self.load_page(page_number).get_text("text", textpage=textpage)
+            entry = (version, fold_text(text))
+            self._search_texts[page_number] = entry
+        return entry[1]
+
 
 
 
@@ -444,6 +1395,12 @@ class PDFViewWidget(QWidget):
     def set_text_style(self, style):
         """Set user's chosen font family, size, color (RGB in 0..1)."""
         self.text_style = style
+        # Resolve once per style change: (base-14 font name, size, color tuple)
+        self.resolved_style = (
+            self.font_map.get(style['font'], "helv"),
+            style['size'],
+            tuple(style['color'])
+        )
 
     def enable_edit_mode(self):
         """Enable editing mode without showing messages."""
@@ -452,9 +1409,9 @@ class PDFViewWidget(QWidget):
         self.setCursor(Qt.IBeamCursor)
         self.current_text_edit.setEnabled(True)
         
-        for i, pg_widget in enumerate(self.page_widgets):
+        for pg_widget in self.page_widgets:
             pg_widget.page_label.setMouseTracking(True)
-            pg_widget.page_label.mousePressEvent = lambda e, idx=i: self.handle_edit_click(e, idx)
+            pg_widget.page_label.mousePressEvent = lambda e, w=pg_widget: self.handle_edit_click(e, w.page_index)
 
     def disable_edit_mode(self):
         """Disable editing mode without showing messages."""
@@ -476,22 +1433,16 @@ class PDFViewWidget(QWidget):
         self.current_page_index = page_idx
         pos = event.pos()
         
-        # Calculate PDF coordinates with proper scaling
-        page = self.doc[page_idx]
-        page_rect = page.rect
-        scale_x = page_rect.width / self.page_widgets[page_idx].page_label.width()
-        scale_y = page_rect.height / self.page_widgets[page_idx].page_label.height()
+        # Calculate PDF coordinates with proper scaling, from the cached page size
+        page_width, page_height = self._page_sizes[page_idx]
+        scale_x = page_width / self.page_widgets[page_idx].page_label.width()
+        scale_y = page_height / self.page_widgets[page_idx].page_label.height()
         
         pdf_x = pos.x() * scale_x
         pdf_y = pos.y() * scale_y
 
         # Check if there's existing text at click position
-        words = page.get_text("words")
-        clicked_word = None
-        for word in words:
-            if (word[0] <= pdf_x <= word[2]) and (word[1] <= pdf_y <= word[3]):
-                clicked_word = word
-                break
+        clicked_word = self.word_at(page_idx, pdf_x, pdf_y)
 
         page_widget = self.page_widgets[page_idx]
         global_pos = page_widget.page_label.mapToGlobal(pos)
@@ -510,15 +1461,13 @@ class PDFViewWidget(QWidget):
             self.current_text_edit.original_word = None
             self.current_text_edit.pdf_position = (pdf_x, pdf_y)
 
-        # Set size based on text length or default
-        text_width = max(180, len(self.current_text_edit.text()) * 10)
+        # Size to the text's rendered width (stylesheet font), with a minimum
+        self.current_text_edit.ensurePolished()
+        metrics = self.current_text_edit.fontMetrics()
+        text_width = max(180, metrics.horizontalAdvance(self.current_text_edit.text()) + 20)
         self.current_text_edit.resize(text_width, 25)
         self.current_text_edit.show()
         self.current_text_edit.setFocus()
-        
-        # Create context menu
-        self.current_text_edit.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.current_text_edit.customContextMenuRequested.connect(self.show_text_edit_menu)
 
     def finish_text_edit(self):
         """Enhanced method to finish text editing."""
@@ -540,27 +1489,29 @@ class PDFViewWidget(QWidget):
             return
 
         try:
-            page = self.doc[self.current_page_index]
+            self.ensure_working_copy()
+            page = self.load_page(self.current_page_index)
             
             # If replacing existing text, delete it first
             if hasattr(self.current_text_edit, 'original_word') and self.current_text_edit.original_word:
                 word = self.current_text_edit.original_word
                 rect = fitz.Rect(word[0], word[1], word[2], word[3])
                 page.add_redact_annot(rect)
-                page.apply_redactions()
+                page.apply_redactions(images=fitz.PDF_REDACT_IMAGE_NONE)
 
             # Insert new text
-            fontname = self.font_map.get(self.text_style['font'], "helv")
+            fontname, fontsize, color = self.resolved_style
             page.insert_text(
                 self.current_text_edit.pdf_position,
                 new_text,
-                fontsize=self.text_style['size'],
+                fontsize=fontsize,
                 fontname=fontname,
-                color=self.text_style['color'],
+                color=color,
                 render_mode=0  # Ensure text is rendered normally
             )
             
-            self.doc.saveIncr()
+            self.mark_dirty(self.current_page_index)
+            self.mark_page_changed(self.current_page_index)
             self.show_page(self.current_page_index)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Could not insert text:\n{str(e)}")
@@ -569,15 +1520,15 @@ class PDFViewWidget(QWidget):
 
     def zoom_in(self):
         """Zoom in on the current PDF."""
-        self.zoom *= 1.2
-        for i in range(len(self.page_widgets)):
-            self.show_page(i)
+        self.zoom = next_zoom_level(self.zoom, 1)
+        self.refresh_pages(preview=True)
+        QTimer.singleShot(0, self.prewarm_adjacent_zooms)
 
     def zoom_out(self):
         """Zoom out on the current PDF."""
-        self.zoom /= 1.2
-        for i in range(len(self.page_widgets)):
-            self.show_page(i)
+        self.zoom = next_zoom_level(self.zoom, -1)
+        self.refresh_pages(preview=True)
+        QTimer.singleShot(0, self.prewarm_adjacent_zooms)
 
     def scroll_to_page(self, page_idx):
         """Scroll to ensure the given page is visible."""
@@ -588,10 +1539,13 @@ class PDFViewWidget(QWidget):
     def highlight_rect(self, page_idx, rect):
         """Highlight the specified rectangle on the given page."""
         if 0 <= page_idx < len(self.page_widgets):
-            page = self.doc[page_idx]
+            self.ensure_working_copy()
+            page = self.load_page(page_idx)
             # Add temporary highlight annotation
             annot = page.add_highlight_annot(rect)
             annot.update()
+            self._unsaved_pages.add(page_idx)
+            self.mark_page_changed(page_idx)
             self.show_page(page_idx)
             # Store highlight for later removal
             if not hasattr(self, 'temp_highlights'):
@@ -601,16 +1555,133 @@ class PDFViewWidget(QWidget):
     def clear_highlights(self):
         """Clear all temporary highlights."""
         if hasattr(self, 'temp_highlights'):
+            pages = set()
             for page_idx, annot in self.temp_highlights:
-                page = self.doc[page_idx]
+                page = self.load_page(page_idx)
                 page.delete_annot(annot)
-                self.show_page(page_idx)
+                pages.add(page_idx)
             self.temp_highlights = []
+            # Re-render each touched page once, not once per removed highlight
+            for page_idx in sorted(pages):
+                self._unsaved_pages.add(page_idx)
+                self.mark_page_changed(page_idx)
+                self.show_page(page_idx)
 
-    def show_page_context_menu(self, pos, page_idx):
-        """Show context menu for the PDF page."""
-        menu = QMenu()
-        menu.exec_(self.page_widgets[page_idx].page_label.mapToGlobal(pos))
+
+###############################################################################
+# TableModel: Editable data behind the Excel/CSV table views
+###############################################################################
+class TableModel(QAbstractTableModel):
+    """
+    Editable table over plain Python rows. Views only ask for the cells they
+    paint, so opening a large sheet doesn't create an item per cell. Rows
+    stay as loaded (tuples) until a cell in them is edited.
+    """
+    def __init__(self, headers, rows, parent=None):
+        super().__init__(parent)
+        self.headers = list(headers)
+        self.rows = list(rows)
+
+    @staticmethod
+    def format_value(value):
+        if value is None or value is pd.NA or value is pd.NaT:
+            return ""
+        if isinstance(value, float) and value != value:  # NaN
+            return ""
+        return str(value)
+
+    def cell_text(self, row, col):
+        values = self.rows[row]
+        return self.format_value(values[col]) if col < len(values) else ""
+
+    def header_text(self, col):
+        return self.headers[col]
+
+    def editable_row(self, row):
+        """Return row `row` as a list padded to the column count, for in-place edits."""
+        values = self.rows[row]
+        if not isinstance(values, list) or len(values) < len(self.headers):
+            values = list(values) + [""] * (len(self.headers) - len(values))
+            self.rows[row] = values
+        return values
+
+    def to_dataframe(self):
+        """The table as a DataFrame, built from the stored rows in one call."""
+        width = len(self.headers)
+        rows = self.rows
+        if any(len(values) != width for values in rows):
+            # Pad/trim ragged rows so every record matches the header
+            rows = [list(values[:width]) + [None] * (width - len(values)) for values in rows]
+        return pd.DataFrame.from_records(rows, columns=self.headers)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role in (Qt.DisplayRole, Qt.EditRole):
+            return self.cell_text(index.row(), index.column())
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        self.editable_row(index.row())[index.column()] = value
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        return super().flags(index) | Qt.ItemIsEditable
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.headers[section] if section < len(self.headers) else None
+        return str(section + 1)
+
+    def setHeaderData(self, section, orientation, value, role=Qt.EditRole):
+        if orientation != Qt.Horizontal or role != Qt.EditRole:
+            return False
+        self.headers[section] = value
+        self.headerDataChanged.emit(orientation, section, section)
+        return True
+
+    def insertRows(self, row, count, parent=QModelIndex()):
+        self.beginInsertRows(parent, row, row + count - 1)
+        self.rows[row:row] = [[""] * len(self.headers) for _ in range(count)]
+        self.endInsertRows()
+        return True
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        count = min(count, len(self.rows) - row)
+        if row < 0 or count <= 0:
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self.rows[row:row + count]
+        self.endRemoveRows()
+        return True
+
+    def insertColumns(self, col, count, parent=QModelIndex()):
+        self.beginInsertColumns(parent, col, col + count - 1)
+        for r in range(len(self.rows)):
+            self.editable_row(r)[col:col] = [""] * count
+        self.headers[col:col] = [f"Column {c + 1}" for c in range(col, col + count)]
+        self.endInsertColumns()
+        return True
+
+    def removeColumns(self, col, count, parent=QModelIndex()):
+        count = min(count, len(self.headers) - col)
+        if col < 0 or count <= 0:
+            return False
+        self.beginRemoveColumns(parent, col, col + count - 1)
+        for r in range(len(self.rows)):
+            del self.editable_row(r)[col:col + count]
+        del self.headers[col:col + count]
+        self.endRemoveColumns()
+        return True
 
 
 ###############################################################################
@@ -629,12 +1700,32 @@ class PDFViewerApp(QMainWindow):
         self.setCentralWidget(self.tab_widget)
 
         self.current_color = (0, 0, 0)  # default black
+        # Style combo changes are applied once scrubbing through a combo pauses
+        self._style_timer = QTimer(self)
+        self._style_timer.setSingleShot(True)
+        self._style_timer.setInterval(150)
+        self._style_timer.timeout.connect(self.apply_text_style)
         self.create_menus()
         self.create_toolbars()
 
         # We'll keep track of whether dark mode is ON or OFF
         self.dark_mode_enabled = False
         self.file_paths = {}  # Store original file paths
+        self.doc_pool = DocumentPool()  # PDFs shared by tabs until edited
+
+        # Extension -> viewer factory, for formats opened on the GUI thread
+        self.viewer_factories = {
+            '.txt': self.create_text_viewer,
+        }
+        # Extension -> (parser, viewer builder, format name), for formats
+        # parsed on the thread pool
+        self.background_loaders = {
+            '.pdf': (read_pdf_layout, self.create_pdf_viewer, "PDF"),
+            '.xlsx': (read_excel_rows, self.create_excel_viewer, "Excel"),
+            '.xls': (read_excel_rows, self.create_excel_viewer, "Excel"),
+            '.csv': (read_csv_rows, self.create_csv_viewer, "CSV"),
+            '.json': (read_json_text, self.create_json_viewer, "JSON"),
+        }
         self.setAttribute(Qt.WA_DeleteOnClose, False)  # Prevent main window from closing
 
     def create_menus(self):
@@ -676,6 +1767,12 @@ class PDFViewerApp(QMainWindow):
 
     def closeEvent(self, event):
         """Handle main window closing."""
+        # Child tabs get no closeEvent of their own; stop their pending saves
+        # and renders and remove their working copies
+        for i in range(self.tab_widget.count()):
+            widget = self.tab_widget.widget(i)
+            if hasattr(widget, 'cleanup_temp_files'):
+                widget.cleanup_temp_files()
         event.accept()
 
     def create_toolbars(self):
@@ -700,15 +1797,19 @@ class PDFViewerApp(QMainWindow):
 
         # Font size combo
         self.size_combo = QComboBox()
-        sizes = ["8","9","10","11","12","14","16","18","20","22","24","28","32","36","48","72"]
-        self.size_combo.addItems(sizes)
+        # Each entry carries its point size as item data
+        for size in (8, 9, 10, 11, 12, 14, 16, 18, 20, 22, 24, 28, 32, 36, 48, 72):
+            self.size_combo.addItem(str(size), float(size))
         self.size_combo.setCurrentText("12")
-        self.size_combo.currentTextChanged.connect(self.update_text_style)
+        self.size_combo.currentIndexChanged.connect(self.update_text_style)
         toolbar.addWidget(self.size_combo)
 
         # Text color combo
         self.color_combo = QComboBox()
-        self.color_combo.addItems(["Black", "Red", "Blue", "Green", "Custom..."])
+        # Each entry carries its RGB tuple as item data
+        for name, rgb in TEXT_COLORS.items():
+            self.color_combo.addItem(name, rgb)
+        self.color_combo.addItem("Custom...")
         self.color_combo.currentTextChanged.connect(self.handle_color_selection)
         toolbar.addWidget(self.color_combo)
 
@@ -750,21 +1851,17 @@ class PDFViewerApp(QMainWindow):
     def add_file_tab(self, file_path):
         try:
             extension = os.path.splitext(file_path)[1].lower()
-            viewer = None
-            
-            if extension == '.pdf':
-                viewer = PDFViewWidget(file_path)
-            elif extension in ['.xlsx', '.xls']:
-                viewer = self.create_excel_viewer(file_path)
-            elif extension == '.csv':
-                viewer = self.create_csv_viewer(file_path)
-            elif extension == '.json':
-                viewer = self.create_json_viewer(file_path)
-            elif extension == '.txt':
-                viewer = self.create_text_viewer(file_path)
-            else:
+
+            loader = self.background_loaders.get(extension)
+            if loader is not None:
+                self.open_in_background(file_path, *loader)
+                return
+
+            factory = self.viewer_factories.get(extension)
+            if factory is None:
                 QMessageBox.warning(self, "Unsupported Format", "This file format is not supported.")
                 return
+            viewer = factory(file_path)
 
             if viewer:
                 filename = os.path.basename(file_path)
@@ -774,9 +1871,65 @@ class PDFViewerApp(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Could not open file:\n{str(e)}")
 
+    def open_in_background(self, file_path, parse, build, kind):
+        """
+        Show a placeholder tab for `file_path` and run `parse` on the global
+        thread pool. `build` turns the parsed result into the viewer widget
+        that replaces the placeholder; `kind` names the format in errors.
+        """
+        placeholder = QLabel("Loading...")
+        placeholder.setAlignment(Qt.AlignCenter)
+        # Save/Save As skip tabs that are still loading
+        placeholder.setProperty("loading", True)
+        index = self.tab_widget.addTab(placeholder, os.path.basename(file_path))
+        self.file_paths[index] = file_path  # Store original file path
+
+        task = ParseTask(parse, file_path, (placeholder, build, kind))
+        task.signals.loaded.connect(self.on_file_parsed)
+        task.signals.failed.connect(self.on_file_parse_failed)
+        QThreadPool.globalInstance().start(task)
+
+    def on_file_parsed(self, context, result):
+        placeholder, build, kind = context
+        if sip.isdeleted(placeholder):
+            return  # Tab was closed while the file was parsing
+        index = self.tab_widget.indexOf(placeholder)
+        if index < 0:
+            return
 
-    def create_excel_viewer(self, file_path):
-        """Create an editable Excel viewer widget with context menu."""
+        viewer = build(result)
+        if viewer is None:
+            self.close_tab(index)
+            return
+
+        was_current = self.tab_widget.currentIndex() == index
+        title = self.tab_widget.tabText(index)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, viewer, title)
+        if was_current:
+            self.tab_widget.setCurrentIndex(index)
+        placeholder.deleteLater()
+
+    def on_file_parse_failed(self, context, message):
+        placeholder, build, kind = context
+        if sip.isdeleted(placeholder):
+            return
+        index = self.tab_widget.indexOf(placeholder)
+        if index < 0:
+            return
+        QMessageBox.warning(self, f"{kind} Error", f"Could not read {kind} file:\n{message}")
+        self.close_tab(index)
+
+    def create_pdf_viewer(self, pdf_layout):
+        """Create a PDF viewer from the (path, page_sizes) pair returned by read_pdf_layout."""
+        pdf_path, page_sizes = pdf_layout
+        return PDFViewWidget(pdf_path, doc_pool=self.doc_pool, page_sizes=page_sizes)
+
+    def create_excel_viewer(self, table_data):
+        """
+        Create an editable Excel viewer widget with context menu from the
+        (headers, rows) pair returned by read_excel_rows.
+        """
         try:
             # Create container widget for table and buttons
             container = QWidget()
@@ -795,25 +1948,26 @@ class PDFViewerApp(QMainWindow):
             
             layout.addLayout(button_layout)
 
-            # Create table widget
-            table = QTableWidget()
-            df = pd.read_excel(file_path)
-            table.setRowCount(df.shape[0])
-            table.setColumnCount(df.shape[1])
-            table.setHorizontalHeaderLabels(df.columns)
+            # Create table view; the model formats cells only as they are painted
+            table = QTableView()
+            headers, rows = table_data
+            table.setModel(TableModel(headers, rows, table))
+            # Fit columns once, measuring a bounded sample of rows rather than all of them
+            table.horizontalHeader().setResizeContentsPrecision(200)
+            table.resizeColumnsToContents()
 
             # Connect buttons to actions
             add_row_btn.clicked.connect(lambda: self.add_table_row(table))
             add_col_btn.clicked.connect(lambda: self.add_table_column(table))
 
             # Make table editable
-            table.setEditTriggers(QTableWidget.DoubleClicked | 
-                                QTableWidget.EditKeyPressed |
-                                QTableWidget.AnyKeyPressed)
+            table.setEditTriggers(QTableView.DoubleClicked | 
+                                QTableView.EditKeyPressed |
+                                QTableView.AnyKeyPressed)
 
             # Enable selection of entire rows/columns
-            table.setSelectionMode(QTableWidget.ExtendedSelection)
-            table.setSelectionBehavior(QTableWidget.SelectRows)
+            table.setSelectionMode(QTableView.ExtendedSelection)
+            table.setSelectionBehavior(QTableView.SelectRows)
             
             # Show row and column headers
             table.horizontalHeader().setVisible(True)
@@ -839,12 +1993,6 @@ class PDFViewerApp(QMainWindow):
                 lambda pos: self.show_header_context_menu(pos, table, 'row')
             )
 
-            # Load data
-            for row in range(df.shape[0]):
-                for col in range(df.shape[1]):
-                    item = QTableWidgetItem(str(df.iloc[row, col]))
-                    table.setItem(row, col, item)
-
             layout.addWidget(table)
             return container
             
@@ -878,19 +2026,21 @@ class PDFViewerApp(QMainWindow):
         menu = QMenu()
         
         # Get selected ranges
-        ranges = table.selectedRanges()
-        if ranges:
+        ranges = table.selectionModel().selection()
+        if not ranges.isEmpty():
             selected_range = ranges[0]
-            if selected_range.rowCount() > 0:
+            top, height = selected_range.top(), selected_range.height()
+            left, width = selected_range.left(), selected_range.width()
+            if height > 0:
                 delete_rows = menu.addAction(f"Delete Selected Row(s)")
                 delete_rows.triggered.connect(
-                    lambda: self.delete_table_rows(table, selected_range.topRow(), selected_range.rowCount())
+                    lambda: self.delete_table_rows(table, top, height)
                 )
             
-            if selected_range.columnCount() > 0:
+            if width > 0:
                 delete_cols = menu.addAction(f"Delete Selected Column(s)")
                 delete_cols.triggered.connect(
-                    lambda: self.delete_table_columns(table, selected_range.leftColumn(), selected_range.columnCount())
+                    lambda: self.delete_table_columns(table, left, width)
                 )
         
         if menu.actions():
@@ -898,16 +2048,17 @@ class PDFViewerApp(QMainWindow):
 
     def delete_table_rows(self, table, start_row, count):
         """Delete multiple rows from the table."""
-        for _ in range(count):
-            table.removeRow(start_row)
+        table.model().removeRows(start_row, count)
 
     def delete_table_columns(self, table, start_col, count):
         """Delete multiple columns from the table."""
-        for _ in range(count):
-                table.removeColumn(start_col)
+        table.model().removeColumns(start_col, count)
 
-    def create_csv_viewer(self, file_path):
-        """Create an editable CSV viewer widget with context menu."""
+    def create_csv_viewer(self, table_data):
+        """
+        Create an editable CSV viewer widget with context menu from the
+        (headers, rows) pair returned by read_csv_rows.
+        """
         try:
             # Create container widget for table and buttons
             container = QWidget()
@@ -926,25 +2077,26 @@ class PDFViewerApp(QMainWindow):
             
             layout.addLayout(button_layout)
 
-            # Create table widget
-            table = QTableWidget()
-            df = pd.read_csv(file_path)
-            table.setRowCount(df.shape[0])
-            table.setColumnCount(df.shape[1])
-            table.setHorizontalHeaderLabels(df.columns)
+            # Create table view; the model formats cells only as they are painted
+            table = QTableView()
+            headers, rows = table_data
+            table.setModel(TableModel(headers, rows, table))
+            # Fit columns once, measuring a bounded sample of rows rather than all of them
+            table.horizontalHeader().setResizeContentsPrecision(200)
+            table.resizeColumnsToContents()
 
             # Connect buttons to actions
             add_row_btn.clicked.connect(lambda: self.add_table_row(table))
             add_col_btn.clicked.connect(lambda: self.add_table_column(table))
 
             # Make table editable
-            table.setEditTriggers(QTableWidget.DoubleClicked | 
-                                QTableWidget.EditKeyPressed |
-                                QTableWidget.AnyKeyPressed)
+            table.setEditTriggers(QTableView.DoubleClicked | 
+                                QTableView.EditKeyPressed |
+                                QTableView.AnyKeyPressed)
 
             # Enable selection of entire rows/columns
-            table.setSelectionMode(QTableWidget.ExtendedSelection)
-            table.setSelectionBehavior(QTableWidget.SelectRows)
+            table.setSelectionMode(QTableView.ExtendedSelection)
+            table.setSelectionBehavior(QTableView.SelectRows)
             
             # Show row and column headers
             table.horizontalHeader().setVisible(True)
@@ -970,12 +2122,6 @@ class PDFViewerApp(QMainWindow):
                 lambda pos: self.show_header_context_menu(pos, table, 'row')
             )
 
-            # Load data
-            for row in range(df.shape[0]):
-                for col in range(df.shape[1]):
-                    item = QTableWidgetItem(str(df.iloc[row, col]))
-                    table.setItem(row, col, item)
-
             layout.addWidget(table)
             return container
 
@@ -985,17 +2131,16 @@ class PDFViewerApp(QMainWindow):
 
     def add_table_row(self, table):
         """Add a new row to the table."""
-        current_row = table.rowCount()
-        table.insertRow(current_row)
-        
-        # Initialize new row with empty items
-        for col in range(table.columnCount()):
-            table.setItem(current_row, col, QTableWidgetItem(""))
+        model = table.model()
+        # New rows start with empty cells
+        model.insertRows(model.rowCount(), 1)
 
     def add_table_column(self, table):
         """Add a new column to the table."""
-        current_col = table.columnCount()
-        table.insertColumn(current_col)
+        model = table.model()
+        current_col = model.columnCount()
+        # New columns start with empty cells
+        model.insertColumns(current_col, 1)
         
         # Show dialog to get column header
         header_name, ok = QInputDialog.getText(
@@ -1007,35 +2152,33 @@ class PDFViewerApp(QMainWindow):
         
         if ok:
             # Set column header
-            table.setHorizontalHeaderItem(
-                current_col, 
-                QTableWidgetItem(header_name)
-            )
-            
-            # Initialize column with empty items
-            for row in range(table.rowCount()):
-                table.setItem(row, current_col, QTableWidgetItem(""))
+            model.setHeaderData(current_col, Qt.Horizontal, header_name)
 
-    def create_json_viewer(self, file_path):
-        """Create an editable JSON viewer that preserves formatting."""
+    def create_json_viewer(self, text):
+        """
+        Create an editable JSON viewer that preserves formatting. `text` is
+        the file's own text as returned by read_json_text.
+        """
         try:
-            with open(file_path, 'r') as f:
-                text = f.read()
-                data = json.loads(text)
-            
             text_edit = QTextEdit()
             text_edit.setPlainText(text)
             
-            def on_text_changed():
+            def validate_json():
                 try:
-                    # Validate JSON while typing
-                    json.loads(text_edit.toPlainText())
-                    text_edit.setStyleSheet("")
+                    parse_json(text_edit.toPlainText())
+                    style = ""
                 except json.JSONDecodeError:
                     # Highlight in red if invalid JSON
-                    text_edit.setStyleSheet("background-color: #FFE4E1;")
-            
-            text_edit.textChanged.connect(on_text_changed)
+                    style = "background-color: #FFE4E1;"
+                if text_edit.styleSheet() != style:
+                    text_edit.setStyleSheet(style)
+
+            # Validate JSON once typing pauses, not on every keystroke
+            validate_timer = QTimer(text_edit)
+            validate_timer.setSingleShot(True)
+            validate_timer.setInterval(250)
+            validate_timer.timeout.connect(validate_json)
+            text_edit.textChanged.connect(validate_timer.start)
             return text_edit
                 
         except Exception as e:
@@ -1045,32 +2188,97 @@ class PDFViewerApp(QMainWindow):
     def create_text_viewer(self, file_path):
         """Create an editable text viewer widget."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text = f.read()
-            
-            # Use QTextEdit instead of QTextBrowser for editing
-            text_edit = QTextEdit()
-            text_edit.setPlainText(text)
-            
-            # Enable editing
-            text_edit.setReadOnly(False)
+            # QPlainTextEdit lays out plain text per block, so large logs stay cheap
+            text_edit = QPlainTextEdit()
             
             # Add basic text formatting options
             font = QFont("Courier")
             font.setPointSize(10)
             text_edit.setFont(font)
-            
+
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return text_edit
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            self.stream_text_into(text_edit, data)
             return text_edit
         except Exception as e:
             QMessageBox.warning(self, "Text Error", f"Could not read text file:\n{str(e)}")
             return None
 
+    def stream_text_into(self, text_edit, data, chunk_size=1 << 20):
+        """
+        Append the UTF-8 text in `data` (an mmap) to `text_edit` one chunk per
+        event-loop pass, so the first screen paints before the whole file is
+        decoded. The editor is read-only and flagged "loading" until done.
+        The first chunk is decoded before returning and errors propagate; if
+        a later chunk fails the editor's tab is closed, so a partial text is
+        never shown as the file or saved.
+        """
+        # Newlines are translated to "\n" like a text-mode read; a "\r" ending
+        # a chunk is held back so a CRLF split across chunks stays one break
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder('utf-8')(), translate=True
+        )
+        cursor = QTextCursor(text_edit.document())
+        state = {'offset': 0}
+
+        text_edit.setReadOnly(True)
+        text_edit.setUndoRedoEnabled(False)
+        text_edit.setProperty("loading", True)
+
+        # Parented to the editor, which close_tab() deletes, so the chain
+        # stops when the tab is closed early; the file is released with it
+        timer = QTimer(text_edit)
+        timer.setInterval(0)
+        text_edit.destroyed.connect(lambda _=None: data.close())
+
+        def load_next_chunk():
+            start = state['offset']
+            end = min(start + chunk_size, len(data))
+            final = end == len(data)
+            # The incremental decoder carries split multi-byte sequences over
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(decoder.decode(data[start:end], final))
+            state['offset'] = end
+            if final:
+                timer.stop()
+                data.close()
+                text_edit.moveCursor(QTextCursor.Start)
+                text_edit.setUndoRedoEnabled(True)
+                text_edit.setReadOnly(False)
+                text_edit.setProperty("loading", False)
+
+        def load_later_chunk():
+            try:
+                load_next_chunk()
+            except Exception as e:
+                timer.stop()
+                data.close()
+                index = self.tab_widget.indexOf(text_edit)
+                if index != -1:
+                    self.close_tab(index)
+                QMessageBox.warning(self, "Text Error", f"Could not read text file:\n{str(e)}")
+
+        try:
+            load_next_chunk()
+        except Exception:
+            data.close()
+            raise
+        if not data.closed:
+            timer.timeout.connect(load_later_chunk)
+            timer.start()
+
     def close_tab(self, index):
         widget = self.tab_widget.widget(index)
         if widget:
             if hasattr(widget, 'cleanup_temp_files'):
                 widget.cleanup_temp_files()
             self.tab_widget.removeTab(index)
+            # removeTab() only unparents the widget; delete it so timers and
+            # loaders owned by it stop
+            widget.deleteLater()
         if index in self.file_paths:
             del self.file_paths[index]
 
@@ -1085,6 +2293,9 @@ class PDFViewerApp(QMainWindow):
         if not current_widget:
             QMessageBox.warning(self, "No File", "No file is open.")
             return
+        if current_widget.property("loading"):
+            QMessageBox.information(self, "Loading", "The file has not finished loading.")
+            return
 
         current_index = self.tab_widget.currentIndex()
         if current_index not in self.file_paths:
@@ -1101,67 +2312,36 @@ class PDFViewerApp(QMainWindow):
                 table = None
                 for i in range(current_widget.layout().count()):
                     item = current_widget.layout().itemAt(i)
-                    if item.widget() and isinstance(item.widget(), QTableWidget):
+                    if item.widget() and isinstance(item.widget(), QTableView):
                         table = item.widget()
                         break
                 
                 if table:
-                    # Get data including headers
-                    headers = []
-                    for col in range(table.columnCount()):
-                        header = table.horizontalHeaderItem(col)
-                        headers.append(header.text() if header else f"Column {col + 1}")
-                    
-                    data = []
-                    for row in range(table.rowCount()):
-                        row_data = []
-                        for col in range(table.columnCount()):
-                            item = table.item(row, col)
-                            # Handle empty cells
-                            cell_value = item.text() if item else ""
-                            row_data.append(cell_value)
-                        data.append(row_data)
-                    
-                    # Create DataFrame and save
-                    df = pd.DataFrame(data, columns=headers)
+                    # Create DataFrame straight from the model's rows and save
+                    df = table.model().to_dataframe()
                     ext = os.path.splitext(original_path)[1].lower()
                     
                     if ext in ['.xlsx', '.xls']:
-                        df.to_excel(original_path, index=False)
+                        write_excel(df, original_path)
                     else:  # CSV
                         df.to_csv(original_path, index=False)
                     success = True
                 else:
                     success = False
             
-            elif isinstance(current_widget, QTableWidget):
-                # Direct table widget
-                data = []
-                headers = []
-                
-                for col in range(current_widget.columnCount()):
-                    header_item = current_widget.horizontalHeaderItem(col)
-                    headers.append(header_item.text() if header_item else f"Column {col+1}")
-                
-                for row in range(current_widget.rowCount()):
-                    row_data = []
-                    for col in range(current_widget.columnCount()):
-                        item = current_widget.item(row, col)
-                        row_data.append(item.text() if item else "")
-                    data.append(row_data)
-                
-                df = pd.DataFrame(data, columns=headers)
+            elif isinstance(current_widget, QTableView):
+                # Direct table view
+                df = current_widget.model().to_dataframe()
                 ext = os.path.splitext(original_path)[1].lower()
                 if ext in ['.xlsx', '.xls']:
-                    df.to_excel(original_path, index=False)
+                    write_excel(df, original_path)
                 else:  # CSV
                     df.to_csv(original_path, index=False)
                 success = True
             
-            elif isinstance(current_widget, (QTextEdit, QTextBrowser)):
+            elif isinstance(current_widget, (QTextEdit, QPlainTextEdit, QTextBrowser)):
                 # Save text content directly to file
-                with open(original_path, 'w', encoding='utf-8') as f:
-                    f.write(current_widget.toPlainText())
+                write_document_text(current_widget.document(), original_path)
                 success = True
             
             else:
@@ -1180,6 +2360,9 @@ class PDFViewerApp(QMainWindow):
         if not current_widget:
             QMessageBox.warning(self, "No File", "Open a file first.")
             return
+        if current_widget.property("loading"):
+            QMessageBox.information(self, "Loading", "The file has not finished loading.")
+            return
 
         # Add back Excel option to filter
         file_filter = (
@@ -1210,29 +2393,16 @@ class PDFViewerApp(QMainWindow):
                 if isinstance(current_widget, QWidget) and current_widget.layout():
                     for i in range(current_widget.layout().count()):
                         item = current_widget.layout().itemAt(i)
-                        if item.widget() and isinstance(item.widget(), QTableWidget):
+                        if item.widget() and isinstance(item.widget(), QTableView):
                             table = item.widget()
                             break
-                elif isinstance(current_widget, QTableWidget):
+                elif isinstance(current_widget, QTableView):
                     table = current_widget
 
                 if table:
-                    data = []
-                    headers = []
-                    for col in range(table.columnCount()):
-                        header_item = table.horizontalHeaderItem(col)
-                        headers.append(header_item.text() if header_item else f"Column {col+1}")
-                    
-                    for row in range(table.rowCount()):
-                        row_data = []
-                        for col in range(table.columnCount()):
-                            item = table.item(row, col)
-                            row_data.append(item.text() if item else "")
-                        data.append(row_data)
-                    
-                    df = pd.DataFrame(data, columns=headers)
+                    df = table.model().to_dataframe()
                     if ext in ['.xlsx', '.xls']:
-                        df.to_excel(file_path, index=False)
+                        write_excel(df, file_path)
                     else:  # CSV
                         df.to_csv(file_path, index=False)
                     success = True
@@ -1244,13 +2414,13 @@ class PDFViewerApp(QMainWindow):
                 else:
                     pdf = fitz.open()
                     page = pdf.new_page()
-                    if isinstance(current_widget, QTableWidget):
+                    if isinstance(current_widget, QTableView):
+                        model = current_widget.model()
                         text = ""
-                        for row in range(current_widget.rowCount()):
+                        for row in range(model.rowCount()):
                             row_text = []
-                            for col in range(current_widget.columnCount()):
-                                item = current_widget.item(row, col)
-                                row_text.append(item.text() if item else "")
+                            for col in range(model.columnCount()):
+                                row_text.append(model.cell_text(row, col))
                             text += "\t".join(row_text) + "\n"
                         page.insert_text((50, 50), text)
                     else:
@@ -1260,27 +2430,27 @@ class PDFViewerApp(QMainWindow):
 
             # Handle JSON/Text
             elif ext in ['.json', '.txt']:
-                content = ""
-                if isinstance(current_widget, (QTextEdit, QTextBrowser)):
-                    content = current_widget.toPlainText()
-                elif isinstance(current_widget, QTableWidget):
-                    # Convert table to JSON/text
-                    data = []
-                    for row in range(current_widget.rowCount()):
-                        row_data = {}
-                        for col in range(current_widget.columnCount()):
-                            header = current_widget.horizontalHeaderItem(col)
-                            key = header.text() if header else f"Column {col+1}"
-                            item = current_widget.item(row, col)
-                            row_data[key] = item.text() if item else ""
-                        data.append(row_data)
-                    if ext == '.json':
-                        content = json.dumps(data, indent=2)
-                    else:
-                        content = str(data)
-
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                if isinstance(current_widget, (QTextEdit, QPlainTextEdit, QTextBrowser)):
+                    write_document_text(current_widget.document(), file_path)
+                else:
+                    content = ""
+                    if isinstance(current_widget, QTableView):
+                        # Convert table to JSON/text
+                        model = current_widget.model()
+                        data = []
+                        for row in range(model.rowCount()):
+                            row_data = {}
+                            for col in range(model.columnCount()):
+                                key = model.header_text(col)
+                                row_data[key] = model.cell_text(row, col)
+                            data.append(row_data)
+                        if ext == '.json':
+                            content = json.dumps(data, indent=2)
+                        else:
+                            content = str(data)
+
+                    with open(file_path, 'w', encoding='utf-8') as f:
+                        f.write(content)
                 success = True
 
             if success:
@@ -1328,7 +2498,7 @@ class PDFViewerApp(QMainWindow):
             QLabel {
                 color: #ffffff;
             }
-            QLineEdit, QTextEdit, QSpinBox, QComboBox {
+            QLineEdit, QTextEdit, QPlainTextEdit, QSpinBox, QComboBox {
                 background-color: #2b2b2b;
                 color: #ffffff;
                 border: 1px solid #5a5a5a;
@@ -1361,15 +2531,15 @@ class PDFViewerApp(QMainWindow):
     # TOOLBAR ACTIONS
     # ---------------------------------------------------------------------
     def update_text_style(self):
+        self._style_timer.start()
+
+    def apply_text_style(self):
         current_widget = self.tab_widget.currentWidget()
         if not current_widget:
             return
 
         font_family = self.font_combo.currentText()
-        try:
-            size = float(self.size_combo.currentText())
-        except ValueError:
-            size = 12
+        size = self.size_combo.currentData() or 12.0
         color = self.current_color
 
         style = {
@@ -1377,27 +2547,24 @@ class PDFViewerApp(QMainWindow):
             'size': size,
             'color': color
         }
-        if hasattr(current_widget, "set_text_style"):
+        # Skip widgets that already use this exact style
+        if hasattr(current_widget, "set_text_style") and current_widget.text_style != style:
             current_widget.set_text_style(style)
 
     def handle_color_selection(self, color_name):
-        color_map = {
-            "Black": (0, 0, 0),
-            "Red": (1, 0, 0),
-            "Blue": (0, 0, 1),
-            "Green": (0, 1, 0)
-        }
         if color_name == "Custom...":
             c = QColorDialog.getColor()
-            if c.isValid():
-                self.current_color = (c.red() / 255, c.green() / 255, c.blue() / 255)
-                new_label = f"Custom ({c.name()})"
+            if not c.isValid():
+                return
+            self.current_color = (c.red() / 255, c.green() / 255, c.blue() / 255)
+            new_label = f"Custom ({c.name()})"
+            # Selecting the new entry must not re-enter this handler
+            with QSignalBlocker(self.color_combo):
                 if self.color_combo.findText(new_label) == -1:
-                    self.color_combo.insertItem(0, new_label)
+                    self.color_combo.insertItem(0, new_label, self.current_color)
                 self.color_combo.setCurrentText(new_label)
-                color_map[new_label] = self.current_color
         else:
-            self.current_color = color_map.get(color_name, (0, 0, 0))
+            self.current_color = self.color_combo.currentData() or (0, 0, 0)
         self.update_text_style()
 
 